@@ -1,6 +1,45 @@
+import asyncio
+import threading
+from typing import Any
+
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from .routes import bp
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes responses with orjson.
+
+    Keeps Flask's key sorting and datetime format, and falls back to Flask's
+    default handling for types orjson doesn't know about.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+def start_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Starts an asyncio event loop running forever in a daemon thread.
+
+    All Blink coroutines are submitted to this loop so the shared
+    ClientSession (and its connection pool) survives across requests.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever,
+        name="blink-event-loop",
+        daemon=True
+    )
+    thread.start()
+    return loop
+
 def create_app():
     """
     Flask application factory.
@@ -10,5 +49,7 @@ def create_app():
         static_folder="../media",
         static_url_path="/media"
     )
+    app.json = OrjsonProvider(app)
+    app.extensions["loop"] = start_event_loop()
     app.register_blueprint(bp)
     return app
@@ -1,35 +1,159 @@
 import asyncio
+import atexit
+import heapq
 import json
+import logging
 import os
-from datetime import datetime, timedelta
+import random
+import time
+from contextlib import aclosing, nullcontext
+from datetime import datetime, timezone
 from json import JSONDecodeError
 from pathlib import Path
 from shutil import copy2
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from blinkpy.auth import Auth
 from blinkpy.blinkpy import Blink, BlinkSyncModule
 from blinkpy.helpers.util import json_load
+from flask import abort
+from slugify import slugify
 
 from .config import Config
-from .helpers import get_since_iso
 
-async def start_blink() -> Tuple[Blink, ClientSession]:
+logger = logging.getLogger(__name__)
+
+def _parse_created_at(created_at: Any) -> Optional[datetime]:
+    """
+    Parses a Blink media `created_at` value (ISO8601), or returns None if it
+    can't be read.
+    """
+    try:
+        return datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+# Date folders already created by this process
+_ensured_dirs: Set[Path] = set()
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Creates path (and its parents) the first time it is seen, so repeated
+    calls for the same folder don't cost any syscalls.
+
+    Only used for the per-clip date folders, whose callers recover if the
+    folder was removed after being cached. Folders created once per request
+    (.idx, latest, camera folders) are always mkdir'ed, so clearing them
+    while the app runs is harmless.
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def _move_to_sorted(src: Path, dst: Path) -> None:
+    """
+    Moves a downloaded clip out of the index and leaves an empty placeholder
+    file under the same name, so the clip is skipped on later downloads.
+    """
+    os.rename(src, dst)
+    # Create the placeholder directly; Path.touch() would first try (and fail)
+    # to utime() the file that was just moved away
+    os.close(os.open(src, os.O_CREAT | os.O_WRONLY, 0o644))
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Hardlinks src to dst, falling back to a full copy when linking isn't
+    possible (e.g. across filesystems or on filesystems without hardlinks).
+
+    Hardlinks look like regular files to media servers such as Plex, and
+    unlinking dst later leaves src untouched.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy2(src, dst)
+
+def _store_clip(
+    data: bytes,
+    fname: str,
+    created_at: Optional[datetime],
+    idx_path: Path,
+    cam_base: Path,
+    latest_path: Path
+) -> str:
     """
-    Initializes and starts a Blink session using credentials from disk
-    (CREDFILE), falling back to USERNAME / PASSWORD env vars if needed.
+    Writes a freshly downloaded clip into the index, moves it into
+    cam_base/YYYY/MM/DD (leaving a placeholder behind) and links it into
+    'latest'.
 
-    This function:
-      1. Creates an aiohttp ClientSession.
-      2. Loads credentials from the configured CREDFILE (or creates it).
-      3. Authenticates and starts the Blink object.
-      4. Returns both the Blink instance and the underlying HTTP session.
+    The date folder comes from the clip's creation time in local time, or
+    the current time if that isn't known.
+
+    This is blocking filesystem work; callers run it in a worker thread. Doing
+    the write and the sort in the same call means a cancelled request (client
+    gone, or timed out) can't strand a full clip in the index: the thread
+    finishes either way, and a clip left unsorted there would be skipped by
+    every later download as already on disk.
+
+    Returns:
+        str: Sorted-folder path of the clip.
+    """
+    src = idx_path / fname
+    src.write_bytes(data)
+
+    when = created_at.astimezone() if created_at is not None else datetime.now()
+    target_folder = cam_base / str(when.year) / f"{when.month:02d}" / f"{when.day:02d}"
+    _ensure_dir(target_folder)
+
+    dst = target_folder / fname
+    # Leaves an empty file with the file name
+    # (This acts as a placeholder in the unsorted directory)
+    try:
+        _move_to_sorted(src, dst)
+    except FileNotFoundError:
+        # The folder was removed after it was cached; recreate it once
+        _ensured_dirs.discard(target_folder)
+        _ensure_dir(target_folder)
+        _move_to_sorted(src, dst)
+
+    # Link into 'latest' folder
+    # Use hardlinks (or copies) instead of symlinks due to media servers like Plex not supporting them
+    _link_or_copy(dst, latest_path / fname)
+    return str(dst)
+
+def _prune_latest(latest_path: Path) -> None:
+    """
+    Trims the 'latest' folder: if RECENTS_HOURS > 0, removes files older than
+    that window; otherwise keeps only the RECENTS_TOTAL newest files.
+
+    Each file is stat'ed once, and mtimes are compared as plain timestamps.
+    """
+    with os.scandir(latest_path) as it:
+        entries = [(e.stat().st_mtime, e.path) for e in it if e.is_file()]
+
+    if Config.RECENTS_HOURS > 0:
+        cutoff_ts = time.time() - Config.RECENTS_WINDOW_SECS
+        for mtime, path in entries:
+            if mtime < cutoff_ts:
+                os.unlink(path)
+    elif len(entries) > Config.RECENTS_TOTAL:
+        # Only the newest RECENTS_TOTAL matter, so avoid sorting everything
+        keep = {path for _, path in heapq.nlargest(Config.RECENTS_TOTAL, entries)}
+        for _, path in entries:
+            if path not in keep:
+                os.unlink(path)
+
+def _load_credentials() -> Path:
+    """
+    Ensures a usable credentials file exists at CREDFILE, falling back to
+    USERNAME / PASSWORD env vars (and writing them to disk) if needed.
 
     Returns:
-        Tuple[Blink, ClientSession]:
-            - The authenticated Blink client, ready for API calls.
-            - The aiohttp ClientSession used by Blink (needed for cleanup).
+        pathlib.Path: Path to the credentials file.
+
+    Raises:
+        FileNotFoundError: If neither the file nor the env vars provide credentials.
     """
     cred_path = Path(Config.CREDFILE)
     creds = {}
@@ -54,13 +178,147 @@ async def start_blink() -> Tuple[Blink, ClientSession]:
             )
         creds = {"username": username, "password": password}
         cred_path.write_text(json.dumps(creds, indent=2))
+    return cred_path
+
+class BlinkClient:
+    """
+    Holds a single authenticated Blink instance and its aiohttp ClientSession
+    for the lifetime of the application, so requests don't re-authenticate.
+
+    The session is bound to the event loop that created it. If a call arrives
+    on a different loop (e.g. a previous one was closed), the stale objects are
+    discarded and a fresh session is started.
+    """
 
-    # Create Blink session
-    session = ClientSession()
-    blink   = Blink(session=session)
-    blink.auth = Auth(await json_load(Config.CREDFILE), session=session)
-    await blink.start()
-    return blink, session
+    def __init__(self) -> None:
+        self._blink: Optional[Blink] = None
+        self._session: Optional[ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Monotonic time each sync module's manifest was last rebuilt from scratch
+        self.manifest_cleared_at: Dict[str, float] = {}
+
+    async def get_blink(self) -> Tuple[Blink, ClientSession]:
+        """
+        Returns the shared Blink client, creating and starting it on first use.
+
+        This function:
+          1. Creates an aiohttp ClientSession with a keep-alive connection pool.
+          2. Loads credentials from the configured CREDFILE (or creates it).
+          3. Authenticates and starts the Blink object, including the network
+             and camera setup (setup_post_verify), once.
+          4. Schedules a background refresh to keep cached data warm.
+
+        Returns:
+            Tuple[Blink, ClientSession]:
+                - The authenticated Blink client, ready for API calls.
+                - The aiohttp ClientSession used by Blink.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._reset(loop)
+
+        if self._blink is not None:
+            return self._blink, self._session
+
+        async with self._lock:
+            if self._blink is None:
+                self._blink, self._session = await self._start()
+                if Config.REFRESH_INTERVAL_SECONDS > 0:
+                    self._refresh_task = loop.create_task(self._refresh_forever())
+        return self._blink, self._session
+
+    async def _start(self) -> Tuple[Blink, ClientSession]:
+        """
+        Creates a ClientSession and a started Blink instance on it.
+
+        The session is closed again if anything during startup fails, so a
+        failed login doesn't leak open connections. Nothing is cached on
+        failure, so the next call runs the full login again.
+
+        Raises:
+            RuntimeError: If blinkpy reports that login or setup failed.
+        """
+        cred_path = _load_credentials()
+        # Blink traffic is nearly all to one host, so cap it per host
+        # too and cache its DNS lookups
+        connector = TCPConnector(
+            limit=Config.HTTP_POOL_LIMIT,
+            limit_per_host=Config.HTTP_POOL_LIMIT,
+            ttl_dns_cache=300,
+            keepalive_timeout=Config.HTTP_KEEPALIVE_SECONDS,
+        )
+        session = ClientSession(connector=connector)
+        try:
+            blink = Blink(session=session)
+            blink.auth = Auth(await json_load(str(cred_path)), session=session)
+            # start() runs setup_post_verify() itself on a successful login;
+            # it returns False (rather than raising) if login or setup failed
+            started = await blink.start()
+            if not started or not blink.auth.token:
+                raise RuntimeError("Could not start Blink session; check credentials")
+        except BaseException:
+            await session.close()
+            raise
+        return blink, session
+
+    async def close(self) -> None:
+        """
+        Stops the background refresh and closes the shared ClientSession.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._session is not None:
+            await self._session.close()
+        self._blink = None
+        self._session = None
+
+    def shutdown(self) -> None:
+        """
+        Synchronous wrapper around close() for use as an atexit hook.
+
+        Skipped if the owning event loop has already been closed, since the
+        session's connections went with it.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or self._session is None:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result(timeout=10)
+        else:
+            loop.run_until_complete(self.close())
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._blink = None
+        self._session = None
+        self._refresh_task = None
+        self.manifest_cleared_at = {}
+        self._lock = asyncio.Lock()
+        self._loop = loop
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(Config.REFRESH_INTERVAL_SECONDS)
+            try:
+                # A plain refresh: forcing one would re-fetch every camera's
+                # thumbnail and clip and rebuild the sync manifests each time
+                await self._blink.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Background Blink refresh failed")
+
+blink_client = BlinkClient()
+atexit.register(blink_client.shutdown)
+
+async def get_blink() -> Tuple[Blink, ClientSession]:
+    """
+    Returns the application-wide Blink client and ClientSession.
+    See BlinkClient.get_blink().
+    """
+    return await blink_client.get_blink()
 
 async def capture_image(camera_name: str) -> Path:
     """    
@@ -77,11 +335,13 @@ async def capture_image(camera_name: str) -> Path:
     Raises:
         HTTPException(404): If the specified camera is not found.
     """
-    blink, session = await start_blink()
+    blink, _ = await get_blink()
     await blink.refresh();
     await asyncio.sleep(5)
 
-    camera = blink.cameras.get(camera_name) or (_cleanup(session), abort(404))
+    camera = blink.cameras.get(camera_name)
+    if camera is None:
+        abort(404, f"Camera '{camera_name}' not found")
     await camera.snap_picture();
     await asyncio.sleep(5)
     
@@ -89,7 +349,6 @@ async def capture_image(camera_name: str) -> Path:
     path = Path(Config.MEDIA_DIR)/camera_name
     path.mkdir(exist_ok=True, parents=True)
     await camera.image_to_file(str(path/Config.LAST_IMAGE_FILENAME))
-    await session.close()
 
 async def download_clips(
     names: Iterable[str],
@@ -114,37 +373,192 @@ async def download_clips(
         Dict[str, List[str]]:
             A mapping from each camera name (or `"all"`) to a list of filesystem
             paths (as strings) of the clips that were just downloaded.  
-            Newly added files are those present after the call that were not
+            Newly added files are the clips blinkpy wrote that were not
             already in the directory.
 
     Raises:
         HTTPException:
             If Blink returns a 404 or other error when targeting a specific camera.
     """
-    blink, session = await start_blink()
+    names = list(names)
+    return await _collect(iter_clips(names, since_iso), names)
+
+def _cloud_clip_name(created_at: Any, camera_name: str) -> str:
+    """
+    Returns the filename blinkpy's download_videos() gives a cloud clip by
+    default (e.g. `front-door-2025-07-02t05-36-54-00-00.mp4`).
+
+    Inlined rather than calling blinkpy's private _format_filename_default():
+    the names must keep matching the clips and .idx placeholders already on
+    disk, or those clips stop being recognised and are downloaded again.
+    """
+    return f"{slugify(f'{camera_name}-{created_at}')}.mp4"
+
+def _group_cloud_videos(
+    videos: Iterable[Dict[str, Any]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Groups Blink cloud media metadata by camera name, dropping deleted clips
+    and entries missing the fields needed to download them (as blinkpy does).
+    """
+    by_cam: Dict[str, List[Dict[str, Any]]] = {}
+    for item in videos:
+        if any(k not in item for k in ("created_at", "device_name", "deleted", "media")):
+            continue
+        if not item["deleted"]:
+            by_cam.setdefault(item["device_name"], []).append(item)
+    return by_cam
+
+def _videos_for(
+    by_cam: Dict[str, List[Dict[str, Any]]],
+    name: str
+) -> List[Dict[str, Any]]:
+    """
+    Returns the grouped metadata for one camera, or for every camera if name
+    is `"all"`.
+    """
+    if name == "all":
+        return [item for items in by_cam.values() for item in items]
+    return by_cam.get(name, [])
+
+async def _iter_cloud_clips(
+    blink: Blink,
+    path: Path,
+    videos: Iterable[Dict[str, Any]],
+    claimed: Set[str],
+    delay: float = 0,
+    limiter: Optional[asyncio.Semaphore] = None
+) -> AsyncIterator[Tuple[str, Optional[datetime], bytes]]:
+    """
+    Fetches the given cloud clips (metadata from _group_cloud_videos()) that
+    aren't in path yet, named by _cloud_clip_name(), the same way
+    blink.download_videos() skips clips already on disk. Writing them is left
+    to the caller.
+
+    Unlike blinkpy, which waits between clips with a blocking time.sleep(),
+    the optional delay here is an asyncio.sleep(), so the rest of the event
+    loop keeps running. Each fetch is status-checked by _fetch_cloud_clip(),
+    so a throttled response is retried instead of being saved as a clip, and
+    limiter (if given) bounds how many clips are transferred at once.
+
+    Names already in claimed are skipped; fetched names are added to it.
+
+    Yields:
+        Tuple[str, Optional[datetime], bytes]: (filename, created_at, clip)
+        for each clip as soon as it has been fetched.
+    """
+    fetched = False
+    for item in videos:
+        created_at = item["created_at"]
+        fname = _cloud_clip_name(created_at, item["device_name"])
+        if fname in claimed or os.path.isfile(path / fname):
+            continue
+        claimed.add(fname)
+
+        if fetched and delay > 0:
+            await asyncio.sleep(delay)
+        fetched = True
+        async with limiter or nullcontext():
+            data = await _fetch_cloud_clip(blink, item["media"])
+        if data is None:
+            # Leave it unclaimed and off disk so the next call tries again
+            claimed.discard(fname)
+            logger.warning("Skipping clip %s; Blink did not return it", fname)
+            continue
+        yield fname, _parse_created_at(created_at), data
+
+async def _fetch_cloud_clip(
+    blink: Blink,
+    address: str,
+    max_retries: int = 5
+) -> Optional[bytes]:
+    """
+    Fetches one cloud clip, returning its bytes only for a 200 response.
+
+    blinkpy's do_http_get() returns the raw response whatever its status (or
+    None if the request failed), so the status has to be checked here. 429
+    (Too Many Requests), 503 (Service Unavailable) and failed requests are
+    retried with exponential backoff and jitter; other statuses are not.
+
+    Returns:
+        Optional[bytes]: The clip, or None if it could not be fetched.
+    """
+    for attempt in range(max_retries):
+        response = await blink.do_http_get(address)
+        status = getattr(response, "status", None)
+        if status == 200:
+            return await response.read()
+        if response is not None:
+            response.release()
+        if status is not None and status not in (429, 503):
+            logger.warning("Blink returned %s for %s", status, address)
+            return None
+        if attempt < max_retries - 1:
+            await asyncio.sleep(_backoff_delay(attempt))
+    return None
+
+async def iter_clips(
+    names: Iterable[str],
+    since_iso: str
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Same as download_clips(), but yields `(camera name, path)` for each new
+    clip as soon as it has been downloaded.
+    """
+    blink, _ = await get_blink()
     await blink.refresh()
-    # expand “all” etc...
-    results = {}
+    # The metadata covers the whole account; fetch it once for every camera
+    by_cam = _group_cloud_videos(await blink.get_videos_metadata(since=since_iso))
     for name in names:
         path = Path(Config.MEDIA_DIR)/name
-        path.mkdir(exist_ok=True, parents=True)
-        before = {f.name for f in path.iterdir() if f.is_file()}
-        # prepare common kwargs
-        kwargs = {
-            "since": since_iso,
-            "delay": 2,
-        }
-        # only pass camera= when targeting a specific camera
-        if name != "all":
-            kwargs["camera"] = name
-
-        # call with positional path, then the rest
-        await blink.download_videos(str(path), **kwargs)
-        after = {f.name for f in path.iterdir() if f.is_file()}
-        results[name] = [str(path/f) for f in sorted(after - before)]
-
-    await session.close()
-    return results
+        path.mkdir(parents=True, exist_ok=True)
+        # Keep the 2-second pause between clips without blocking the loop
+        clips = _iter_cloud_clips(blink, path, _videos_for(by_cam, name), set(), delay=2)
+        async with aclosing(clips):
+            async for fname, _, data in clips:
+                await asyncio.to_thread((path/fname).write_bytes, data)
+                yield name, str(path/fname)
+
+async def _process_camera(
+    name: str,
+    blink: Blink,
+    videos: List[Dict[str, Any]],
+    base: Path,
+    idx_path: Path,
+    latest_path: Path,
+    clip_semaphore: asyncio.Semaphore,
+    claimed: Set[str]
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Downloads the given new clips for one camera (or `"all"`) into the index,
+    filing each into its date folder and linking it into 'latest' as soon as
+    it arrives.
+
+    Waits 2 seconds between clips, as download_clips does, but with
+    asyncio.sleep(), so other cameras keep downloading in the meantime.
+
+    clip_semaphore and claimed are shared by every camera in the request, so
+    at most MAX_PARALLEL_CLIPS clips are in flight and no clip is filed
+    twice; callers also pass targets through _unique_targets().
+
+    Yields:
+        Tuple[str, str]: `(camera name, sorted-folder path)` for each new clip.
+    """
+    cam_base = base / name if name != "all" else base
+    cam_base.mkdir(parents=True, exist_ok=True)
+
+    # Download straight into the shared index. blinkpy's download_videos()
+    # can't be used here: it blocks the loop with time.sleep() between clips
+    # and writes whatever body Blink returns, even a 429 error page
+    clips = _iter_cloud_clips(
+        blink, idx_path, videos, claimed, delay=2, limiter=clip_semaphore
+    )
+    async with aclosing(clips):
+        async for fname, created_at, data in clips:
+            # Writing and sorting touch the disk; keep them off the event loop
+            yield name, await asyncio.to_thread(
+                _store_clip, data, fname, created_at, idx_path, cam_base, latest_path
+            )
 
 async def download_clips_index_and_sort(
     names: Iterable[str],
@@ -158,8 +572,11 @@ async def download_clips_index_and_sort(
     The /.idx directory stores empty files that match the filename of a sorted
     video file.
 
-    Includes a 2-second pause between each clip download to avoid overwhelming
-    the Blink service.
+    Includes a 2-second pause between each camera's clip downloads to avoid
+    overwhelming the Blink service. Cameras are processed concurrently, up to
+    MAX_PARALLEL_CAMERAS at a time, and at most MAX_PARALLEL_CLIPS clips are
+    transferred at once. Throttled (429/503) clip downloads are retried with
+    backoff.
 
     Args:
         names (Iterable[str]):
@@ -180,7 +597,19 @@ async def download_clips_index_and_sort(
         HTTPException:
             If Blink returns a 404 or other error when targeting a specific camera.
     """
-    blink, session = await start_blink()
+    names = list(names)
+    return await _collect(iter_clips_index_and_sort(names, since_iso), names)
+
+async def iter_clips_index_and_sort(
+    names: Iterable[str],
+    since_iso: str
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Same as download_clips_index_and_sort(), but yields `(camera name, path)`
+    for each new clip as soon as it has been sorted. The 'latest' folder is
+    pruned once every camera is done.
+    """
+    blink, _ = await get_blink()
     await blink.refresh()
 
     base = Path(Config.MEDIA_DIR)
@@ -189,80 +618,212 @@ async def download_clips_index_and_sort(
     idx_path.mkdir(parents=True, exist_ok=True)
     latest_path.mkdir(parents=True, exist_ok=True)
 
-    results: Dict[str, List[str]] = {}
+    # The metadata covers the whole account; fetch it once and split it by
+    # camera rather than have every camera task page through all of it
+    by_cam = _group_cloud_videos(await blink.get_videos_metadata(since=since_iso))
 
-    for name in names:
-        cam_base = base / name if name != "all" else base
-        cam_base.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(Config.MAX_PARALLEL_CAMERAS)
+    clip_semaphore = asyncio.Semaphore(Config.MAX_PARALLEL_CLIPS)
+    claimed: Set[str] = set()
 
-        before = {f.name for f in idx_path.iterdir() if f.is_file()}
-        kwargs = {"since": since_iso, "delay": 2}
-        if name != "all":
-            kwargs["camera"] = name
+    async def bounded(name: str) -> AsyncIterator[Tuple[str, str]]:
+        async with semaphore:
+            clips = _process_camera(
+                name, blink, _videos_for(by_cam, name), base, idx_path,
+                latest_path, clip_semaphore, claimed
+            )
+            async with aclosing(clips):
+                async for clip in clips:
+                    yield clip
 
-        await blink.download_videos(str(idx_path), **kwargs)
+    # Each clip in the shared index must belong to exactly one task
+    targets = _unique_targets(names)
+    async with aclosing(_merge_clips(bounded(n) for n in targets)) as clips:
+        async for clip in clips:
+            yield clip
 
-        after = {f.name for f in idx_path.iterdir() if f.is_file()}
-        new_files = sorted(after - before)
-        results[name] = []
+    # Prune 'latest' folder
+    await asyncio.to_thread(_prune_latest, latest_path)
 
-        for fname in new_files:
-            src = idx_path / fname
-            mtime = datetime.fromtimestamp(src.stat().st_mtime)
-            target_folder = cam_base / str(mtime.year) / f"{mtime.month:02d}" / f"{mtime.day:02d}"
-            target_folder.mkdir(parents=True, exist_ok=True)
+def _unique_targets(names: Iterable[str]) -> List[str]:
+    """
+    Deduplicates the requested camera names for the shared-index downloads.
 
-            dst = target_folder / fname
-            src.rename(dst)
-            (idx_path / fname).touch()
-            results[name].append(str(dst))
+    "all" already covers every camera, so it replaces any other names;
+    otherwise repeated names are dropped, keeping their order.
+    """
+    names = list(dict.fromkeys(names))
+    return ["all"] if "all" in names else names
 
-            # Copy to 'latest' folder
-            # Use copies instead of symlinks due to media servers like Plex not supporting them
-            copy_dst = latest_path / fname
-            copy2(dst, copy_dst)
+async def _collect(
+    clips: AsyncIterator[Tuple[str, str]],
+    names: Iterable[str]
+) -> Dict[str, List[str]]:
+    """
+    Drains a `(camera name, path)` iterator into a mapping from each camera
+    name to the sorted paths of its downloaded clips.
+    """
+    results: Dict[str, List[str]] = {n: [] for n in names}
+    async for name, path in clips:
+        results[name].append(path)
+    for paths in results.values():
+        paths.sort()
+    return results
 
-    # Prune 'latest' folder
-    files = sorted(
-        [f for f in latest_path.iterdir() if f.is_file()],
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
+async def _merge_clips(
+    streams: Iterable[AsyncIterator[Tuple[str, str]]]
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Runs per-camera clip iterators concurrently and yields `(camera name, path)`
+    for each clip as soon as any camera produces it. Whatever is still running
+    is cancelled if one of them fails or the consumer stops early.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
 
-    if Config.RECENTS_HOURS > 0:
-        window = timedelta(hours=Config.RECENTS_HOURS)
-        cutoff = datetime.now() - window
-        for f in files:
-            if datetime.fromtimestamp(f.stat().st_mtime) < cutoff:
-                f.unlink()
+    async def drain(stream: AsyncIterator[Tuple[str, str]]) -> None:
+        async with aclosing(stream):
+            async for clip in stream:
+                queue.put_nowait(clip)
+
+    tasks = [asyncio.ensure_future(drain(s)) for s in streams]
+    # Finished tasks are queued behind their clips, marking that stream as done
+    for task in tasks:
+        task.add_done_callback(queue.put_nowait)
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if isinstance(item, asyncio.Future):
+                remaining -= 1
+                item.result()  # re-raise a camera's failure
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter for the given (0-based) retry attempt,
+    capped at one minute.
+    """
+    return min(60, 0.5 * 2 ** attempt) + random.random()
+
+async def _download_sync_item(
+    item: Any,
+    blink: Blink,
+    max_retries: int = 3
+) -> Optional[bytes]:
+    """
+    Asks the sync module to upload a clip, then downloads it.
+
+    blinkpy's prepare_download() returns None for any failed request,
+    throttling (429/503) included, so those attempts are retried with
+    exponential backoff and jitter. The clip itself is fetched with
+    _fetch_cloud_clip() instead of item.download_video(): that retries every
+    non-200 four more times with its own ~45 seconds of sleeps, including a
+    404 for a clip since removed from the sync module, which isn't throttling.
+
+    Returns:
+        Optional[bytes]: The clip, or None if it could not be fetched.
+    """
+    for attempt in range(max_retries):
+        if await item.prepare_download(blink) is not None:
+            break
+        if attempt < max_retries - 1:
+            await asyncio.sleep(_backoff_delay(attempt))
     else:
-        for f in files[Config.RECENTS_TOTAL:]:
-            f.unlink()
+        return None
+    return await _fetch_cloud_clip(blink, item.url())
+
+async def _process_sync_camera(
+    cam_name: str,
+    blink: Blink,
+    items: List[Any],
+    base: Path,
+    idx_path: Path,
+    latest_path: Path,
+    clip_semaphore: asyncio.Semaphore,
+    claimed: Set[str]
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Downloads the given sync-module clips for one camera (or `"all"`) into
+    the index, filing each into its date folder and linking it into 'latest'
+    as soon as it arrives.
 
-    await session.close()
-    return results
+    claimed is shared by every camera in the request, so no clip is fetched
+    twice; callers also pass targets through _unique_targets().
+
+    Yields:
+        Tuple[str, str]: `(camera name, sorted-folder path)` for each new clip.
+    """
+    cam_base = base / cam_name if cam_name != "all" else base
+
+    async def download(item) -> Optional[str]:
+        # Build filename and idx path
+        filename = f"{item.name}_{item.created_at.isoformat().replace(':','_')}.mp4"
+        idx_file = idx_path / filename
+
+        # Skip if we've already downloaded this clip
+        if filename in claimed or idx_file.exists():
+            return None
+        claimed.add(filename)
+
+        async with clip_semaphore:
+            data = await _download_sync_item(item, blink)
+        if data is None:
+            return None
+        # Write the clip and move it to its sorted folder, off the event loop
+        return await asyncio.to_thread(
+            _store_clip, data, filename, item.created_at, idx_path, cam_base, latest_path
+        )
+
+    # Download the clips concurrently, yielding each one as soon as it's filed
+    tasks = [asyncio.ensure_future(download(i)) for i in items]
+    try:
+        for done in asyncio.as_completed(tasks):
+            path = await done
+            if path:
+                yield cam_name, path
+    finally:
+        for task in tasks:
+            task.cancel()
 
 async def download_sync_clips_index_and_sort(
     names: Iterable[str],
-    since_iso: str
+    since: Union[str, datetime]
 ) -> Dict[str, List[str]]:
     """
     Uses the Blink Sync Module API to download new clips into a central index,
     sort them into date folders, and maintain a 'latest' folder based on
     time or count settings since the given ISO8601 timestamp.
 
+    Cameras are processed concurrently, up to MAX_PARALLEL_CAMERAS at a time,
+    and at most MAX_PARALLEL_CLIPS clips are transferred at once.
+
     Args:
         names: An iterable of camera names to target, or ['all'] to process every camera.
-        since_iso: An ISO8601 timestamp; only clips created at or after this time are fetched.
+        since: A datetime or ISO8601 timestamp; only clips created at or after this
+            time are fetched. Naive values are treated as UTC.
 
     Returns:
         A mapping from each camera name (or 'all') to a list of filesystem paths
         of the clips that were just downloaded.
     """
+    names = list(names)
+    return await _collect(iter_sync_clips_index_and_sort(names, since), names)
+
+async def iter_sync_clips_index_and_sort(
+    names: Iterable[str],
+    since: Union[str, datetime]
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Same as download_sync_clips_index_and_sort(), but yields
+    `(camera name, path)` for each new clip as soon as it has been sorted.
+    The 'latest' folder is pruned once every camera is done.
+    """
     # Initialize blink session
-    blink, session = await start_blink()
-    await blink.start()
-    await blink.setup_post_verify()
+    blink, _ = await get_blink()
 
     # Use the network's first sync module
     if not blink.sync:
@@ -277,95 +838,66 @@ async def download_sync_clips_index_and_sort(
     idx_path.mkdir(parents=True, exist_ok=True)
     latest_path.mkdir(parents=True, exist_ok=True)
 
-    results: Dict[str, List[str]] = {n: [] for n in names}
+    # Start from an empty manifest only once the cached one is old enough
+    # that clips since removed from the sync module may still be listed
+    now = time.monotonic()
+    cleared_at = blink_client.manifest_cleared_at.get(net_name)
+    if cleared_at is None or now - cleared_at > Config.MANIFEST_MAX_AGE_SECONDS:
+        sync._local_storage["manifest"].clear()
+        blink_client.manifest_cleared_at[net_name] = now
 
-    # Refresh sync module manifest until ready
-    sync._local_storage["manifest"].clear()
-    while True:
+    # Refresh sync module manifest until ready, backing off between checks
+    for delay in (0.25, 0.5, 1, 2, 4, 8):
         await sync.refresh()
         if sync.local_storage_manifest_ready:
             break
-        await asyncio.sleep(1)
+        await asyncio.sleep(delay)
+    else:
+        raise TimeoutError(f"Local storage manifest for '{net_name}' was not ready")
 
     # Filter the manifest of what to download
-    since_dt = datetime.fromisoformat(since_iso.replace("Z", "+00:00"))
+    if isinstance(since, str):
+        since = datetime.fromisoformat(since.replace("Z", "+00:00"))
+    since_dt = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
     manifest = sync._local_storage["manifest"]
+    manifest_id = sync._local_storage["last_manifest_id"]
+    recent = [item for item in manifest if item.created_at >= since_dt]
+    by_cam: Dict[str, List[Any]] = {}
+    for item in recent:
+        # Items kept from an earlier refresh still carry the manifest id they
+        # were listed under; point their clip URLs at the current manifest
+        item.url(manifest_id)
+        by_cam.setdefault(item.name, []).append(item)
+
+    semaphore = asyncio.Semaphore(Config.MAX_PARALLEL_CAMERAS)
+    clip_semaphore = asyncio.Semaphore(Config.MAX_PARALLEL_CLIPS)
+    claimed: Set[str] = set()
+
+    async def bounded(cam_name: str) -> AsyncIterator[Tuple[str, str]]:
+        async with semaphore:
+            items = recent if cam_name == "all" else by_cam.get(cam_name, [])
+            clips = _process_sync_camera(
+                cam_name, blink, items, base, idx_path, latest_path,
+                clip_semaphore, claimed
+            )
+            async with aclosing(clips):
+                async for clip in clips:
+                    yield clip
 
-    for cam_name in names:
-        # Track existing index files to detect new ones
-        before = {p.name for p in idx_path.iterdir() if p.is_file()}
-
-        items = [
-            item for item in manifest
-            if item.created_at >= since_dt
-            and (cam_name == "all" or item.name == cam_name)
-        ]
-
-        # Download each clip
-        for item in items:
-            # Build filename and idx path
-            filename = f"{item.name}_{item.created_at.isoformat().replace(':','_')}.mp4"
-            idx_file = idx_path / filename
-
-            # Skip if we've already downloaded this clip
-            if idx_file.exists():
-                continue
-
-            await item.prepare_download(blink)
-            await item.download_video(blink, str(idx_file))
-
-            # Intentional throttle when working the API
-            await asyncio.sleep(2)
-
-        # Determine the new files
-        after    = {p.name for p in idx_path.iterdir() if p.is_file()}
-        new_files = sorted(after - before)
-
-        # Copy the file to the appropriate sorted folder
-        # and create the placeholder idx file
-        for fname in new_files:
-            src = idx_path / fname
-            mtime = datetime.fromtimestamp(src.stat().st_mtime)
-            datedir = base / (cam_name if cam_name!="all" else "") \
-                       / str(mtime.year) / f"{mtime.month:02d}" / f"{mtime.day:02d}"
-            datedir.mkdir(parents=True, exist_ok=True)
-
-            dst = datedir / fname
-            src.rename(dst)
-
-            # Touch to create an empty file with the file name
-            # (This acts as a placeholder in the unsorted directory)
-            (idx_path / fname).touch()
-
-            # Copy the new files into latest
-            copy2(dst, latest_path / fname)
-
-            results[cam_name].append(str(dst))
+    # Each clip in the shared index must belong to exactly one task
+    targets = _unique_targets(names)
+    async with aclosing(_merge_clips(bounded(n) for n in targets)) as clips:
+        async for clip in clips:
+            yield clip
 
     # Prune the /latest folder using RECENTS_HOURS or RECENTS_TOTAL
-    all_latest = sorted(
-        [f for f in latest_path.iterdir() if f.is_file()],
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
-
-    if Config.RECENTS_HOURS > 0:
-        cutoff = datetime.now() - timedelta(hours=Config.RECENTS_HOURS)
-        for f in all_latest:
-            if datetime.fromtimestamp(f.stat().st_mtime) < cutoff:
-                f.unlink()
-    else:
-        for f in all_latest[Config.RECENTS_TOTAL:]:
-            f.unlink()
-
-    await session.close()
-    return results
+    await asyncio.to_thread(_prune_latest, latest_path)
 
 async def list_cameras() -> List[Dict[str, Any]]:
     """
     Retrieves a list of all Blink cameras and returns their attribute dictionaries.
 
-    Connects to the Blink service, refreshes the camera list, then closes the session.
+    Uses the shared Blink session and refreshes the camera list.
 
     Returns:
         List[Dict[str, Any]]: A list where each entry is the `.attributes` dict of a Blink camera.
@@ -374,8 +906,7 @@ async def list_cameras() -> List[Dict[str, Any]]:
         HTTPException:
             If the Blink API returns an error during refresh or retrieval.
     """
-    blink, session = await start_blink()
+    blink, _ = await get_blink()
     await blink.refresh()
     cams = [cam.attributes for cam in blink.cameras.values()]
-    await session.close()
     return cams
@@ -20,6 +20,26 @@ class Config:
     
     # If > 0, only include videos within the last X hours
     RECENTS_HOURS = get_env_int("RECENTS_HOURS", 0)
+    RECENTS_WINDOW_SECS = RECENTS_HOURS * 3600
     
     # Maximum number of videos to keep in 'latest' when RECENTS_HOURS == 0
     RECENTS_TOTAL = get_env_int("RECENTS_TOTAL", 20)
+
+    # Seconds between background refreshes of the shared Blink session (0 disables)
+    REFRESH_INTERVAL_SECONDS = get_env_int("REFRESH_INTERVAL_SECONDS", 300)
+
+    # Connection pool settings for the shared aiohttp session
+    HTTP_POOL_LIMIT = get_env_int("HTTP_POOL_LIMIT", 8)
+    HTTP_KEEPALIVE_SECONDS = get_env_int("HTTP_KEEPALIVE_SECONDS", 60)
+
+    # Max seconds a route waits on the background event loop
+    ASYNC_TIMEOUT_SECONDS = get_env_int("ASYNC_TIMEOUT_SECONDS", 230)
+
+    # Max number of cameras downloaded concurrently by the sort endpoints
+    MAX_PARALLEL_CAMERAS = get_env_int("MAX_PARALLEL_CAMERAS", 3)
+
+    # Max number of clips transferred concurrently
+    MAX_PARALLEL_CLIPS = get_env_int("MAX_PARALLEL_CLIPS", 2)
+
+    # Max seconds a cached sync module manifest is reused before being rebuilt
+    MANIFEST_MAX_AGE_SECONDS = get_env_int("MANIFEST_MAX_AGE_SECONDS", 3600)
@@ -1,19 +1,103 @@
-from flask import abort
+import asyncio
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, AsyncIterator, Awaitable, Iterator
+from flask import abort, current_app
 from datetime import datetime, timezone
 from .config import Config
 
-def get_since_iso() -> str:
+def run_async(coro: Awaitable[Any]) -> Any:
     """
-    Compute an ISO-formatted timestamp representing the cutoff for downloads.
+    Run a coroutine on the application's background event loop and wait for it.
+
+    Args:
+        coro (Awaitable): The coroutine to execute.
+
+    Returns:
+        Any: Whatever the coroutine returns.
+
+    Raises:
+        TimeoutError: If the coroutine does not finish within ASYNC_TIMEOUT_SECONDS.
+    """
+    loop = current_app.extensions["loop"]
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout=Config.ASYNC_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        future.cancel()
+        raise TimeoutError(
+            f"Blink request did not finish within {Config.ASYNC_TIMEOUT_SECONDS} seconds"
+        )
+
+def iter_async(agen: AsyncIterator[Any]) -> Iterator[Any]:
+    """
+    Iterate an async generator from a regular (Flask) thread by pulling each
+    item through the application's background event loop.
+
+    The loop is looked up immediately, so the returned iterator can be
+    consumed after the request context is gone (e.g. by a streaming response).
+
+    The whole stream shares one ASYNC_TIMEOUT_SECONDS deadline, the same budget
+    as run_async(), so it ends within gunicorn's worker timeout however many
+    items it yields.
+
+    Args:
+        agen (AsyncIterator): The async generator to drain.
+
+    Returns:
+        Iterator: Yields the generator's items in order.
+
+    Raises:
+        TimeoutError: If the stream does not finish within ASYNC_TIMEOUT_SECONDS.
+    """
+    loop = current_app.extensions["loop"]
+
+    def pull() -> Iterator[Any]:
+        deadline = time.monotonic() + Config.ASYNC_TIMEOUT_SECONDS
+        try:
+            while True:
+                future = asyncio.run_coroutine_threadsafe(agen.__anext__(), loop)
+                try:
+                    remaining = max(0.0, deadline - time.monotonic())
+                    yield future.result(timeout=remaining)
+                except StopAsyncIteration:
+                    return
+                except FutureTimeoutError:
+                    future.cancel()
+                    raise TimeoutError(
+                        f"Blink request did not finish within {Config.ASYNC_TIMEOUT_SECONDS} seconds"
+                    )
+        finally:
+            # Stop the generator (and any downloads it started) if the client went away
+            closing = asyncio.run_coroutine_threadsafe(agen.aclose(), loop)
+            try:
+                closing.result(timeout=10)
+            except (RuntimeError, FutureTimeoutError):
+                # Still unwinding from a cancelled step; it finishes on its own
+                pass
+
+    return pull()
+
+def get_since_dt() -> datetime:
+    """
+    Compute the UTC datetime representing the cutoff for downloads.
 
     Subtracts a fixed TIMEDELTA from the current UTC time to determine
     how far back to fetch clips.
 
+    Returns:
+        datetime: A timezone-aware UTC datetime.
+    """
+    return datetime.now(timezone.utc) - Config.TIMEDELTA
+
+def get_since_iso() -> str:
+    """
+    Compute an ISO-formatted timestamp representing the cutoff for downloads.
+
     Returns:
         str: An ISO-formatted timestamp (e.g. "2025-07-01T12:34:56.789012+00:00").
     """
-    now_utc = datetime.now(timezone.utc)
-    return (now_utc - Config.TIMEDELTA).isoformat()
+    return get_since_dt().isoformat()
 
 def normalize_camera_names(cams):
     """
@@ -1,11 +1,31 @@
-import asyncio
-from flask import Blueprint, request, jsonify, abort, url_for
-from .helpers import get_since_iso, normalize_camera_names
-from .blink_service import capture_image, download_clips, download_clips_index_and_sort, download_sync_clips_index_and_sort, list_cameras
+from typing import AsyncIterator, Tuple
+from flask import Blueprint, Response, request, json, jsonify, abort, url_for, stream_with_context
+from .helpers import get_since_dt, get_since_iso, iter_async, normalize_camera_names, run_async
+from .blink_service import capture_image, download_clips, download_clips_index_and_sort, download_sync_clips_index_and_sort, iter_clips, iter_clips_index_and_sort, iter_sync_clips_index_and_sort, list_cameras
 from .config import Config
 
 bp = Blueprint("api", __name__)
 
+def stream_clips(since_iso: str, clips: AsyncIterator[Tuple[str, str]]) -> Response:
+    """
+    Stream downloaded clips as NDJSON, flushing each clip as soon as it lands.
+
+    The first line is {"since": "<ISO>"}, followed by one
+    {"camera": "<name>", "path": "<path>"} line per clip. If the download
+    fails part-way, a final {"error": "<message>"} line is sent instead.
+    """
+    items = iter_async(clips)
+
+    def generate():
+        yield json.dumps({"since": since_iso}) + "\n"
+        try:
+            for camera, path in items:
+                yield json.dumps({"camera": camera, "path": path}) + "\n"
+        except Exception as e:
+            yield json.dumps({"error": str(e)}) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
 @bp.route("/get-camera-info", methods=["GET"])
 def get_camera_info():
     """
@@ -15,7 +35,7 @@ def get_camera_info():
     Returns JSON: {"cameras": [...]}
     """
     try:
-        cams = asyncio.run(list_cameras())
+        cams = run_async(list_cameras())
         return jsonify(cameras=cams)
     except Exception as e:
         abort(500, str(e))
@@ -33,7 +53,7 @@ def snap_camera():
     if "camera_name" not in data:
         abort(400, "Missing 'camera_name'")
     try:
-        asyncio.run(capture_image(data["camera_name"]))
+        run_async(capture_image(data["camera_name"]))
     except Exception as e:
         abort(500, str(e))
     url = url_for("static", filename=f"{data['camera_name']}/{Config.LAST_IMAGE_FILENAME}", _external=True)
@@ -45,14 +65,16 @@ def download_recent_clips():
     POST /download-recent-clips
     ----------------------
     Download clips from all (or specified) cameras since the last run.
-    Expects JSON: {"camera_name": "<name>|all"} (optional)
-    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}
+    Expects JSON: {"camera_name": "<name>|all", "stream": true|false} (both optional)
+    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}, or NDJSON lines if "stream" is true
     """
     data = request.get_json() or {}
     names = normalize_camera_names(data.get("camera_name","all"))
     since_iso = get_since_iso()
+    if data.get("stream"):
+        return stream_clips(since_iso, iter_clips(names, since_iso))
     try:
-        clips = asyncio.run(download_clips(names, since_iso))
+        clips = run_async(download_clips(names, since_iso))
         return jsonify(since=since_iso, downloaded_clips=clips)
     except Exception as e:
         abort(500, str(e))
@@ -64,14 +86,16 @@ def download_recent_clips_and_sort():
     ----------------------
     Download clips from all (or specified) cameras since the last run.
     Sort into subfolders based on the timestamp and update the /latest folder.
-    Expects JSON: {"camera_name": "<name>|all"} (optional)
-    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}
+    Expects JSON: {"camera_name": "<name>|all", "stream": true|false} (both optional)
+    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}, or NDJSON lines if "stream" is true
     """
     data = request.get_json() or {}
     names = normalize_camera_names(data.get("camera_name","all"))
     since_iso = get_since_iso()
+    if data.get("stream"):
+        return stream_clips(since_iso, iter_clips_index_and_sort(names, since_iso))
     try:
-        clips = asyncio.run(download_clips_index_and_sort(names, since_iso))
+        clips = run_async(download_clips_index_and_sort(names, since_iso))
         return jsonify(since=since_iso, downloaded_clips=clips)
     except Exception as e:
         abort(500, str(e))
@@ -83,15 +107,17 @@ def download_recent_sync_clips_and_sort():
     ----------------------
     Download clips from all (or specified) cameras via the sync module since the last run.
     Sort into subfolders based on the timestamp and update the /latest folder.
-    Expects JSON: {"camera_name": "<name>|all"} (optional)
-    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}
+    Expects JSON: {"camera_name": "<name>|all", "stream": true|false} (both optional)
+    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}, or NDJSON lines if "stream" is true
     """
     data = request.get_json() or {}
     names = normalize_camera_names(data.get("camera_name","all"))
-    since_iso = get_since_iso()
+    since_dt = get_since_dt()
+    if data.get("stream"):
+        return stream_clips(since_dt.isoformat(), iter_sync_clips_index_and_sort(names, since_dt))
     try:
-        clips = asyncio.run(download_sync_clips_index_and_sort(names, since_iso))
-        return jsonify(since=since_iso, downloaded_clips=clips)
+        clips = run_async(download_sync_clips_index_and_sort(names, since_dt))
+        return jsonify(since=since_dt.isoformat(), downloaded_clips=clips)
     except Exception as e:
         abort(500, str(e))
 
@@ -101,14 +127,16 @@ def download_clips_since():
     POST /download-clips-since
     ----------------------
     Download clips from all (or specified) cameras since a given timestamp.
-    Expects JSON: {"camera_name": "<name>|all", "since": "<ISO>"} (since optional)
-    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}
+    Expects JSON: {"camera_name": "<name>|all", "since": "<ISO>", "stream": true|false} (since, stream optional)
+    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}, or NDJSON lines if "stream" is true
     """
     data = request.get_json() or {}
     names = normalize_camera_names(data.get("camera_name","all"))
     since_iso = data.get("since") or get_since_iso()
+    if data.get("stream"):
+        return stream_clips(since_iso, iter_clips(names, since_iso))
     try:
-        clips = asyncio.run(download_clips(names, since_iso))
+        clips = run_async(download_clips(names, since_iso))
         return jsonify(since=since_iso, downloaded_clips=clips)
     except Exception as e:
         abort(500, str(e))
@@ -120,14 +148,16 @@ def download_clips_since_and_sort():
     ----------------------
     Download clips from all (or specified) cameras since a given timestamp.
     Sort into subfolders based on the timestamp and update the /latest folder.
-    Expects JSON: {"camera_name": "<name>|all", "since": "<ISO>"} (since optional)
-    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}
+    Expects JSON: {"camera_name": "<name>|all", "since": "<ISO>", "stream": true|false} (since, stream optional)
+    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}, or NDJSON lines if "stream" is true
     """
     data = request.get_json() or {}
     names = normalize_camera_names(data.get("camera_name","all"))
     since_iso = data.get("since") or get_since_iso()
+    if data.get("stream"):
+        return stream_clips(since_iso, iter_clips_index_and_sort(names, since_iso))
     try:
-        clips = asyncio.run(download_clips_index_and_sort(names, since_iso))
+        clips = run_async(download_clips_index_and_sort(names, since_iso))
         return jsonify(since=since_iso, downloaded_clips=clips)
     except Exception as e:
         abort(500, str(e))
@@ -139,14 +169,16 @@ def download_sync_clips_since_and_sort():
     ----------------------
     Download clips from all (or specified) cameras via the sync module since the last run.
     Sort into subfolders based on the timestamp and update the /latest folder.
-    Expects JSON: {"camera_name": "<name>|all"} (optional)
-    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}
+    Expects JSON: {"camera_name": "<name>|all", "stream": true|false} (both optional)
+    Returns JSON: {"since": "<ISO>", "downloaded_clips": [...]}, or NDJSON lines if "stream" is true
     """
     data = request.get_json() or {}
     names = normalize_camera_names(data.get("camera_name","all"))
-    since_iso = get_since_iso()
+    since_dt = get_since_dt()
+    if data.get("stream"):
+        return stream_clips(since_dt.isoformat(), iter_sync_clips_index_and_sort(names, since_dt))
     try:
-        clips = asyncio.run(download_sync_clips_index_and_sort(names, since_iso))
-        return jsonify(since=since_iso, downloaded_clips=clips)
+        clips = run_async(download_sync_clips_index_and_sort(names, since_dt))
+        return jsonify(since=since_dt.isoformat(), downloaded_clips=clips)
     except Exception as e:
         abort(500, str(e))
\ No newline at end of file